@@ -1,652 +1,6 @@
 // Auto-generated file list - do not edit manually
 class AbcFileList {
     static getFiles() {
-        return [
-        {
-                "name": "When Johnny Comes Marching Home",
-                "file": "american/when johnny comes marching home.abc",
-                "category": "american"
-        },
-        {
-                "name": "Which Side Are You On?",
-                "file": "american/which side are you on.abc",
-                "category": "american"
-        },
-        {
-                "name": "Waltzing Matilda",
-                "file": "australian/waltzing matilda.abc",
-                "category": "australian"
-        },
-        {
-                "name": "Ach du lieber Augustin",
-                "file": "austrian/lieber augustin.abc",
-                "category": "austrian"
-        },
-        {
-                "name": "Es wird scho gleich dumpa",
-                "file": "austrian/es wird scho gleich dumpa.abc",
-                "category": "austrian"
-        },
-        {
-                "name": "1 Joc cu bata",
-                "file": "bartok/romanian folk dances/1 joc cu bata.abc",
-                "category": "bartok/romanian folk dances"
-        },
-        {
-                "name": "2 Braul",
-                "file": "bartok/romanian folk dances/2 braul.abc",
-                "category": "bartok/romanian folk dances"
-        },
-        {
-                "name": "Atirei o Pau no Gato",
-                "file": "brazilian/atirei o pau no gato.abc",
-                "category": "brazilian"
-        },
-        {
-                "name": "AAA Dongjia chimi wo chikang",
-                "file": "chinese/670_songs.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Alamuhan \u963f\u62c9\u6728\u6c57",
-                "file": "chinese/alamuhan.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Baobao Yao Shuijiao \u5bf6\u5bf6\u7761\u89ba",
-                "file": "chinese/baobao yao shuijiao.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Caicha Wuqu \u91c7\u8336\u821e\u66f2",
-                "file": "chinese/caicha wuqu.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Gan Shengling \u8d76\u7272\u7075",
-                "file": "chinese/gan shengling.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Geming shengli zaixiangfeng",
-                "file": "chinese/geming.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Huang hua cao",
-                "file": "chinese/huang hua cao.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Liangshanbo",
-                "file": "chinese/liangshanbo.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Meili de Caoyuan Wo de Jia \u7f8e\u4e3d\u7684\u8349\u539f\u6211\u7684\u5bb6",
-                "file": "chinese/meili de caoyuan.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Molihua \u8309\u8389\u82b1",
-                "file": "chinese/molihua.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Na Jiushi Wo \u90a3\u5c31\u662f\u6211",
-                "file": "chinese/na jiushi wo.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Nianqing de Pengyou Lai Xianghui \u5e74\u8f7b\u7684\u670b\u53cb\u6765\u76f8\u4f1a",
-                "file": "chinese/nianqing de pengyou.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Nigu Sifan",
-                "file": "chinese/nigu sifan.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Women de Shenghuo Chongman Yangguang \u6211\u4eec\u7684\u751f\u6d3b\u5145\u6ee1\u9633\u5149",
-                "file": "chinese/chongman yangguang.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Wusuli Chuan'ge \u4e4c\u82cf\u91cc\u8239\u6b4c",
-                "file": "chinese/wusuli chuange.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Yue'er Ming \u6708\u513f\u660e",
-                "file": "chinese/yue er ming.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Yueguang Ge",
-                "file": "chinese/yueguang ge.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Zai Xiwang de Tianye Shang \u5728\u5e0c\u671b\u7684\u7530\u91ce\u4e0a",
-                "file": "chinese/xiwang de tianye.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "Zou Xikou",
-                "file": "chinese/zou xikou.abc",
-                "category": "chinese"
-        },
-        {
-                "name": "10. Aus tiefer Not schrei ich zu dir",
-                "file": "classical/bach/tiefer_not.abc",
-                "category": "classical/bach"
-        },
-        {
-                "name": "100. Durch Adams Fall ist ganz verderbt",
-                "file": "classical/bach/adams_fall.abc",
-                "category": "classical/bach"
-        },
-        {
-                "name": "Invention 1 BWV 772",
-                "file": "classical/bach/inventions/invention 01.abc",
-                "category": "classical/bach/inventions"
-        },
-        {
-                "name": "10. M. John Langtons Pavan",
-                "file": "classical/dowland/pavane lachrimae.abc",
-                "category": "classical/dowland"
-        },
-        {
-                "name": "Die Forelle",
-                "file": "classical/schubert/forelle.abc",
-                "category": "classical/schubert"
-        },
-        {
-                "name": "Impromptu",
-                "file": "classical/schubert/impromptus/impromptus 1.abc",
-                "category": "classical/schubert/impromptus"
-        },
-        {
-                "name": "Waltz No.2",
-                "file": "classical/shostakovich/waltz 2.abc",
-                "category": "classical/shostakovich"
-        },
-        {
-                "name": "Theme from \"Swan Lake\"",
-                "file": "classical/tchaikovsky/swan lake theme.abc",
-                "category": "classical/tchaikovsky"
-        },
-        {
-                "name": "Amawole",
-                "file": "congolese/amawole.abc",
-                "category": "congolese"
-        },
-        {
-                "name": "Na Tom Bo\u0161ileck\u00fdm Mostku",
-                "file": "czech/na tom bosileckym mostku.abc",
-                "category": "czech"
-        },
-        {
-                "name": "Sarasponda",
-                "file": "dutch/sarasponda.abc",
-                "category": "dutch"
-        },
-        {
-                "name": "Largo From \"The new world\"",
-                "file": "dvorak/new world/going home.abc",
-                "category": "dvorak/new world"
-        },
-        {
-                "name": "A Ya Zein",
-                "file": "egyptian/a ya zein.abc",
-                "category": "egyptian"
-        },
-        {
-                "name": "Here's to you",
-                "file": "film/here's to you.abc",
-                "category": "film"
-        },
-        {
-                "name": "A Town with an Ocean view",
-                "file": "film/hisaishi/kiki_town.abc",
-                "category": "film/hisaishi"
-        },
-        {
-                "name": "Mononoke Hime",
-                "file": "film/hisaishi/mononoke.abc",
-                "category": "film/hisaishi"
-        },
-        {
-                "name": "Summer",
-                "file": "film/hisaishi/summer.abc",
-                "category": "film/hisaishi"
-        },
-        {
-                "name": "Ievan Polkka",
-                "file": "finnish/ievan_polkka.abc",
-                "category": "finnish"
-        },
-        {
-                "name": "Ai vist lo lop",
-                "file": "french/ai vist lo lop.abc",
-                "category": "french"
-        },
-        {
-                "name": "Reel du r\u00e9prtoire des fr\u00e8res Pigeon",
-                "file": "french/Reel du repertoire des freres pigeon.abc",
-                "category": "french"
-        },
-        {
-                "name": "Gandagana",
-                "file": "georgian/gandagana.abc",
-                "category": "georgian"
-        },
-        {
-                "name": "Muss i denn",
-                "file": "german/muss i denn.abc",
-                "category": "german"
-        },
-        {
-                "name": "Tue Tue",
-                "file": "ghanaian/tue tue.abc",
-                "category": "ghanaian"
-        },
-        {
-                "name": "Aloha \u02bbOe",
-                "file": "hawaiian/aloha oe.abc",
-                "category": "hawaiian"
-        },
-        {
-                "name": "B\u00fajj, B\u00fajj, Z\u00f6ld \u00c1g",
-                "file": "hungarian/bujj bujj zold ag.abc",
-                "category": "hungarian"
-        },
-        {
-                "name": "Vande Mataram",
-                "file": "indian/vande mataram.abc",
-                "category": "indian"
-        },
-        {
-                "name": "Rasa Sayange",
-                "file": "indonesian/rasa sayange.abc",
-                "category": "indonesian"
-        },
-        {
-                "name": "Johnny I Hardly Knew Ya",
-                "file": "irish/johnny i hardly knew ya.abc",
-                "category": "irish"
-        },
-        {
-                "name": "The Wild Rover",
-                "file": "irish/the wild rover.abc",
-                "category": "irish"
-        },
-        {
-                "name": "Hava Nagila",
-                "file": "israeli/hava nagila.abc",
-                "category": "israeli"
-        },
-        {
-                "name": "Bandiera Rossa",
-                "file": "italian/bandiera_rossa.abc",
-                "category": "italian"
-        },
-        {
-                "name": "Bella Ciao",
-                "file": "italian/bella ciao.abc",
-                "category": "italian"
-        },
-        {
-                "name": "Tarantella Napoletana",
-                "file": "italian/tarantella napoletana.abc",
-                "category": "italian"
-        },
-        {
-                "name": "Banana Boat Song",
-                "file": "jamaican/banana boat song.abc",
-                "category": "jamaican"
-        },
-        {
-                "name": "Hana",
-                "file": "japanese/hana.abc",
-                "category": "japanese"
-        },
-        {
-                "name": "Kojo no Tsuki",
-                "file": "japanese/kojo no tsuki.abc",
-                "category": "japanese"
-        },
-        {
-                "name": "Sakura",
-                "file": "japanese/sakura.abc",
-                "category": "japanese"
-        },
-        {
-                "name": "All Of Me",
-                "file": "jazz/all of me.abc",
-                "category": "jazz"
-        },
-        {
-                "name": "Mayila",
-                "file": "kazakh/mayila.abc",
-                "category": "kazakh"
-        },
-        {
-                "name": "Jambo Bwana",
-                "file": "kenyan/jambo bwana.abc",
-                "category": "kenyan"
-        },
-        {
-                "name": "Arirang",
-                "file": "korean/arirang.abc",
-                "category": "korean"
-        },
-        {
-                "name": "Villoldo Que Haces Chamberguito",
-                "file": "latino/chamberguito.abc",
-                "category": "latino"
-        },
-        {
-                "name": "Te Hokinga Mai",
-                "file": "maori/te hokinga mai.abc",
-                "category": "maori"
-        },
-        {
-                "name": "Cielito Lindo",
-                "file": "mexican/cielito lindo.abc",
-                "category": "mexican"
-        },
-        {
-                "name": "A Ram Sam Sam",
-                "file": "moroccan/a ram sam sam.abc",
-                "category": "moroccan"
-        },
-        {
-                "name": "Bortkomne sauen",
-                "file": "norwegian/bortkomne.abc",
-                "category": "norwegian"
-        },
-        {
-                "name": "El Condor Pasa",
-                "file": "peruvian/el condor pasa.abc",
-                "category": "peruvian"
-        },
-        {
-                "name": "Bahay Kubo",
-                "file": "philippine/bahay kubo.abc",
-                "category": "philippine"
-        },
-        {
-                "name": "Dandansoy",
-                "file": "philippine/dandansoy.abc",
-                "category": "philippine"
-        },
-        {
-                "name": "Ili-Ili Tulog Anay",
-                "file": "philippine/ili-ili tulog anay.abc",
-                "category": "philippine"
-        },
-        {
-                "name": "Leron Leron Sinta",
-                "file": "philippine/leron leron sinta.abc",
-                "category": "philippine"
-        },
-        {
-                "name": "Pamulinawen",
-                "file": "philippine/pamulinawen.abc",
-                "category": "philippine"
-        },
-        {
-                "name": "Dwa serduszka",
-                "file": "polish/dwa serduszka.abc",
-                "category": "polish"
-        },
-        {
-                "name": "Popcorn",
-                "file": "pop/popcorn.abc",
-                "category": "pop"
-        },
-        {
-                "name": "Somebody I Used to Know",
-                "file": "pop/used to know.abc",
-                "category": "pop"
-        },
-        {
-                "name": "Tequila",
-                "file": "pop/tequila.abc",
-                "category": "pop"
-        },
-        {
-                "name": "The Final Countdown",
-                "file": "pop/final_countdown.abc",
-                "category": "pop"
-        },
-        {
-                "name": "Top of the world",
-                "file": "pop/top of the world.abc",
-                "category": "pop"
-        },
-        {
-                "name": "Yakety Sax",
-                "file": "pop/yakety sax.abc",
-                "category": "pop"
-        },
-        {
-                "name": "A Swingin' Safari",
-                "file": "pop/bert kaempfert/a swingin safari.abc",
-                "category": "pop/bert kaempfert"
-        },
-        {
-                "name": "Tootie Flutie",
-                "file": "pop/bert kaempfert/tootie flutie.abc",
-                "category": "pop/bert kaempfert"
-        },
-        {
-                "name": "Mario Theme",
-                "file": "pop/game/mario theme.abc",
-                "category": "pop/game"
-        },
-        {
-                "name": "Dorme, Dorme, Meu Menino",
-                "file": "portuguese/dorme dorme meu menino.abc",
-                "category": "portuguese"
-        },
-        {
-                "name": "Chromatic Scale C to d'",
-                "file": "practice/chromatic_scale.abc",
-                "category": "practice"
-        },
-        {
-                "name": "Kalinka",
-                "file": "russian/kalinka.abc",
-                "category": "russian"
-        },
-        {
-                "name": "Korobeiniki",
-                "file": "russian/korobeiniki.abc",
-                "category": "russian"
-        },
-        {
-                "name": "Russian hymn",
-                "file": "russian/russian hymn.abc",
-                "category": "russian"
-        },
-        {
-                "name": "The Red Army Is The Strongest",
-                "file": "russian/the red army is the strongest.abc",
-                "category": "russian"
-        },
-        {
-                "name": "Atholl Braes #1",
-                "file": "scottish/atholl_braes_1.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Balquidder Lasses",
-                "file": "scottish/balquidder_lasses.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Birkhall",
-                "file": "scottish/birkhall.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Bottom of the Punchbowl, The",
-                "file": "scottish/bottom_bowl.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Caber Feigh",
-                "file": "scottish/caber_feigh.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Clanranald",
-                "file": "scottish/clanranald.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Fairy Dance, The",
-                "file": "scottish/fairy_dance.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Fang the Fiddlers",
-                "file": "scottish/fang_fiddlers.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Francis T Robertson",
-                "file": "scottish/francis_robertson.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Frank's Reel",
-                "file": "scottish/franks_reel.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Highland Fling",
-                "file": "scottish/highland_fling.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Highland Skip 1",
-                "file": "scottish/highland_skip.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Irving Steeple",
-                "file": "scottish/irving_steeple.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Sweet Molly",
-                "file": "scottish/hopetoun_house.abc",
-                "category": "scottish"
-        },
-        {
-                "name": "Grogg Mayles",
-                "file": "shanty/grogg mayles.abc",
-                "category": "shanty"
-        },
-        {
-                "name": "Shosholoza",
-                "file": "south african/shosholoza.abc",
-                "category": "south african"
-        },
-        {
-                "name": "Nanita Nana",
-                "file": "spanish/nanita nana.abc",
-                "category": "spanish"
-        },
-        {
-                "name": "Akta dig f\u00f6r flickor",
-                "file": "swedish/akta dig f\u00f6r flickor.abc",
-                "category": "swedish"
-        },
-        {
-                "name": "Bua Kao \u0e1a\u0e31\u0e27\u0e02\u0e32\u0e27",
-                "file": "thai/bua kao.abc",
-                "category": "thai"
-        },
-        {
-                "name": "\u00dcsk\u00fcdar'a Gider \u0130ken",
-                "file": "turkish/uskudara gider iken.abc",
-                "category": "turkish"
-        },
-        {
-                "name": "A-Team Theme",
-                "file": "tv/a-team.abc",
-                "category": "tv"
-        },
-        {
-                "name": "Detective Conan Theme",
-                "file": "tv/detective_conan.abc",
-                "category": "tv"
-        },
-        {
-                "name": "Fraggle Rock Theme",
-                "file": "tv/fraggle rock.abc",
-                "category": "tv"
-        },
-        {
-                "name": "Mwana Wa Nnyabo",
-                "file": "ugandan/mwana wa nnyabo.abc",
-                "category": "ugandan"
-        },
-        {
-                "name": "Nich Yaka Misyachna",
-                "file": "ukrainian/nich yaka misyachna.abc",
-                "category": "ukrainian"
-        },
-        {
-                "name": "",
-                "file": "unsorted/test.abc",
-                "category": "unsorted"
-        },
-        {
-                "name": "Spin the Wheel",
-                "file": "unsorted/spin the wheel.abc",
-                "category": "unsorted"
-        },
-        {
-                "name": "The People United",
-                "file": "unsorted/people united.abc",
-                "category": "unsorted"
-        },
-        {
-                "name": "B\u00e8o D\u1ea1t M\u00e2y Tr\u00f4i",
-                "file": "vietnamese/beo dat may troi.abc",
-                "category": "vietnamese"
-        },
-        {
-                "name": "Chiribim Chiribom",
-                "file": "yiddish/chiribim.abc",
-                "category": "yiddish"
-        },
-        {
-                "name": "Daloy Politsey",
-                "file": "yiddish/daloy politsey.abc",
-                "category": "yiddish"
-        },
-        {
-                "name": "Dos Kelbl",
-                "file": "yiddish/dos kelbl.abc",
-                "category": "yiddish"
-        },
-        {
-                "name": "In Kamf",
-                "file": "yiddish/in kamf.abc",
-                "category": "yiddish"
-        },
-        {
-                "name": "Kankuluwe",
-                "file": "zambian/kankuluwe.abc",
-                "category": "zambian"
-        }
-];
+        return JSON.parse('[{"name":"When Johnny Comes Marching Home","file":"american/when johnny comes marching home.abc","category":"american"},{"name":"Which Side Are You On?","file":"american/which side are you on.abc","category":"american"},{"name":"Waltzing Matilda","file":"australian/waltzing matilda.abc","category":"australian"},{"name":"Ach du lieber Augustin","file":"austrian/lieber augustin.abc","category":"austrian"},{"name":"Es wird scho gleich dumpa","file":"austrian/es wird scho gleich dumpa.abc","category":"austrian"},{"name":"1 Joc cu bata","file":"bartok/romanian folk dances/1 joc cu bata.abc","category":"bartok/romanian folk dances"},{"name":"2 Braul","file":"bartok/romanian folk dances/2 braul.abc","category":"bartok/romanian folk dances"},{"name":"Atirei o Pau no Gato","file":"brazilian/atirei o pau no gato.abc","category":"brazilian"},{"name":"AAA Dongjia chimi wo chikang","file":"chinese/670_songs.abc","category":"chinese"},{"name":"Alamuhan 阿拉木汗","file":"chinese/alamuhan.abc","category":"chinese"},{"name":"Baobao Yao Shuijiao 寶寶睡覺","file":"chinese/baobao yao shuijiao.abc","category":"chinese"},{"name":"Caicha Wuqu 采茶舞曲","file":"chinese/caicha wuqu.abc","category":"chinese"},{"name":"Gan Shengling 赶牲灵","file":"chinese/gan shengling.abc","category":"chinese"},{"name":"Geming shengli zaixiangfeng","file":"chinese/geming.abc","category":"chinese"},{"name":"Huang hua cao","file":"chinese/huang hua cao.abc","category":"chinese"},{"name":"Liangshanbo","file":"chinese/liangshanbo.abc","category":"chinese"},{"name":"Meili de Caoyuan Wo de Jia 美丽的草原我的家","file":"chinese/meili de caoyuan.abc","category":"chinese"},{"name":"Molihua 茉莉花","file":"chinese/molihua.abc","category":"chinese"},{"name":"Na Jiushi Wo 那就是我","file":"chinese/na jiushi wo.abc","category":"chinese"},{"name":"Nianqing de Pengyou Lai Xianghui 年轻的朋友来相会","file":"chinese/nianqing de pengyou.abc","category":"chinese"},{"name":"Nigu Sifan","file":"chinese/nigu sifan.abc","category":"chinese"},{"name":"Women de Shenghuo Chongman Yangguang 我们的生活充满阳光","file":"chinese/chongman yangguang.abc","category":"chinese"},{"name":"Wusuli Chuan\'ge 乌苏里船歌","file":"chinese/wusuli chuange.abc","category":"chinese"},{"name":"Yue\'er Ming 月儿明","file":"chinese/yue er ming.abc","category":"chinese"},{"name":"Yueguang Ge","file":"chinese/yueguang ge.abc","category":"chinese"},{"name":"Zai Xiwang de Tianye Shang 在希望的田野上","file":"chinese/xiwang de tianye.abc","category":"chinese"},{"name":"Zou Xikou","file":"chinese/zou xikou.abc","category":"chinese"},{"name":"10. Aus tiefer Not schrei ich zu dir","file":"classical/bach/tiefer_not.abc","category":"classical/bach"},{"name":"100. Durch Adams Fall ist ganz verderbt","file":"classical/bach/adams_fall.abc","category":"classical/bach"},{"name":"Invention 1 BWV 772","file":"classical/bach/inventions/invention 01.abc","category":"classical/bach/inventions"},{"name":"10. M. John Langtons Pavan","file":"classical/dowland/pavane lachrimae.abc","category":"classical/dowland"},{"name":"Die Forelle","file":"classical/schubert/forelle.abc","category":"classical/schubert"},{"name":"Impromptu","file":"classical/schubert/impromptus/impromptus 1.abc","category":"classical/schubert/impromptus"},{"name":"Waltz No.2","file":"classical/shostakovich/waltz 2.abc","category":"classical/shostakovich"},{"name":"Theme from \\"Swan Lake\\"","file":"classical/tchaikovsky/swan lake theme.abc","category":"classical/tchaikovsky"},{"name":"Amawole","file":"congolese/amawole.abc","category":"congolese"},{"name":"Na Tom Bošileckým Mostku","file":"czech/na tom bosileckym mostku.abc","category":"czech"},{"name":"Sarasponda","file":"dutch/sarasponda.abc","category":"dutch"},{"name":"Largo From \\"The new world\\"","file":"dvorak/new world/going home.abc","category":"dvorak/new world"},{"name":"A Ya Zein","file":"egyptian/a ya zein.abc","category":"egyptian"},{"name":"Here\'s to you","file":"film/here\'s to you.abc","category":"film"},{"name":"A Town with an Ocean view","file":"film/hisaishi/kiki_town.abc","category":"film/hisaishi"},{"name":"Mononoke Hime","file":"film/hisaishi/mononoke.abc","category":"film/hisaishi"},{"name":"Summer","file":"film/hisaishi/summer.abc","category":"film/hisaishi"},{"name":"Ievan Polkka","file":"finnish/ievan_polkka.abc","category":"finnish"},{"name":"Ai vist lo lop","file":"french/ai vist lo lop.abc","category":"french"},{"name":"Reel du réprtoire des frères Pigeon","file":"french/Reel du repertoire des freres pigeon.abc","category":"french"},{"name":"Gandagana","file":"georgian/gandagana.abc","category":"georgian"},{"name":"Muss i denn","file":"german/muss i denn.abc","category":"german"},{"name":"Tue Tue","file":"ghanaian/tue tue.abc","category":"ghanaian"},{"name":"Aloha ʻOe","file":"hawaiian/aloha oe.abc","category":"hawaiian"},{"name":"Bújj, Bújj, Zöld Ág","file":"hungarian/bujj bujj zold ag.abc","category":"hungarian"},{"name":"Vande Mataram","file":"indian/vande mataram.abc","category":"indian"},{"name":"Rasa Sayange","file":"indonesian/rasa sayange.abc","category":"indonesian"},{"name":"Johnny I Hardly Knew Ya","file":"irish/johnny i hardly knew ya.abc","category":"irish"},{"name":"The Wild Rover","file":"irish/the wild rover.abc","category":"irish"},{"name":"Hava Nagila","file":"israeli/hava nagila.abc","category":"israeli"},{"name":"Bandiera Rossa","file":"italian/bandiera_rossa.abc","category":"italian"},{"name":"Bella Ciao","file":"italian/bella ciao.abc","category":"italian"},{"name":"Tarantella Napoletana","file":"italian/tarantella napoletana.abc","category":"italian"},{"name":"Banana Boat Song","file":"jamaican/banana boat song.abc","category":"jamaican"},{"name":"Hana","file":"japanese/hana.abc","category":"japanese"},{"name":"Kojo no Tsuki","file":"japanese/kojo no tsuki.abc","category":"japanese"},{"name":"Sakura","file":"japanese/sakura.abc","category":"japanese"},{"name":"All Of Me","file":"jazz/all of me.abc","category":"jazz"},{"name":"Mayila","file":"kazakh/mayila.abc","category":"kazakh"},{"name":"Jambo Bwana","file":"kenyan/jambo bwana.abc","category":"kenyan"},{"name":"Arirang","file":"korean/arirang.abc","category":"korean"},{"name":"Villoldo Que Haces Chamberguito","file":"latino/chamberguito.abc","category":"latino"},{"name":"Te Hokinga Mai","file":"maori/te hokinga mai.abc","category":"maori"},{"name":"Cielito Lindo","file":"mexican/cielito lindo.abc","category":"mexican"},{"name":"A Ram Sam Sam","file":"moroccan/a ram sam sam.abc","category":"moroccan"},{"name":"Bortkomne sauen","file":"norwegian/bortkomne.abc","category":"norwegian"},{"name":"El Condor Pasa","file":"peruvian/el condor pasa.abc","category":"peruvian"},{"name":"Bahay Kubo","file":"philippine/bahay kubo.abc","category":"philippine"},{"name":"Dandansoy","file":"philippine/dandansoy.abc","category":"philippine"},{"name":"Ili-Ili Tulog Anay","file":"philippine/ili-ili tulog anay.abc","category":"philippine"},{"name":"Leron Leron Sinta","file":"philippine/leron leron sinta.abc","category":"philippine"},{"name":"Pamulinawen","file":"philippine/pamulinawen.abc","category":"philippine"},{"name":"Dwa serduszka","file":"polish/dwa serduszka.abc","category":"polish"},{"name":"Popcorn","file":"pop/popcorn.abc","category":"pop"},{"name":"Somebody I Used to Know","file":"pop/used to know.abc","category":"pop"},{"name":"Tequila","file":"pop/tequila.abc","category":"pop"},{"name":"The Final Countdown","file":"pop/final_countdown.abc","category":"pop"},{"name":"Top of the world","file":"pop/top of the world.abc","category":"pop"},{"name":"Yakety Sax","file":"pop/yakety sax.abc","category":"pop"},{"name":"A Swingin\' Safari","file":"pop/bert kaempfert/a swingin safari.abc","category":"pop/bert kaempfert"},{"name":"Tootie Flutie","file":"pop/bert kaempfert/tootie flutie.abc","category":"pop/bert kaempfert"},{"name":"Mario Theme","file":"pop/game/mario theme.abc","category":"pop/game"},{"name":"Dorme, Dorme, Meu Menino","file":"portuguese/dorme dorme meu menino.abc","category":"portuguese"},{"name":"Chromatic Scale C to d\'","file":"practice/chromatic_scale.abc","category":"practice"},{"name":"Kalinka","file":"russian/kalinka.abc","category":"russian"},{"name":"Korobeiniki","file":"russian/korobeiniki.abc","category":"russian"},{"name":"Russian hymn","file":"russian/russian hymn.abc","category":"russian"},{"name":"The Red Army Is The Strongest","file":"russian/the red army is the strongest.abc","category":"russian"},{"name":"Atholl Braes #1","file":"scottish/atholl_braes_1.abc","category":"scottish"},{"name":"Balquidder Lasses","file":"scottish/balquidder_lasses.abc","category":"scottish"},{"name":"Birkhall","file":"scottish/birkhall.abc","category":"scottish"},{"name":"Bottom of the Punchbowl, The","file":"scottish/bottom_bowl.abc","category":"scottish"},{"name":"Caber Feigh","file":"scottish/caber_feigh.abc","category":"scottish"},{"name":"Clanranald","file":"scottish/clanranald.abc","category":"scottish"},{"name":"Fairy Dance, The","file":"scottish/fairy_dance.abc","category":"scottish"},{"name":"Fang the Fiddlers","file":"scottish/fang_fiddlers.abc","category":"scottish"},{"name":"Francis T Robertson","file":"scottish/francis_robertson.abc","category":"scottish"},{"name":"Frank\'s Reel","file":"scottish/franks_reel.abc","category":"scottish"},{"name":"Highland Fling","file":"scottish/highland_fling.abc","category":"scottish"},{"name":"Highland Skip 1","file":"scottish/highland_skip.abc","category":"scottish"},{"name":"Irving Steeple","file":"scottish/irving_steeple.abc","category":"scottish"},{"name":"Sweet Molly","file":"scottish/hopetoun_house.abc","category":"scottish"},{"name":"Grogg Mayles","file":"shanty/grogg mayles.abc","category":"shanty"},{"name":"Shosholoza","file":"south african/shosholoza.abc","category":"south african"},{"name":"Nanita Nana","file":"spanish/nanita nana.abc","category":"spanish"},{"name":"Akta dig för flickor","file":"swedish/akta dig för flickor.abc","category":"swedish"},{"name":"Bua Kao บัวขาว","file":"thai/bua kao.abc","category":"thai"},{"name":"Üsküdar\'a Gider İken","file":"turkish/uskudara gider iken.abc","category":"turkish"},{"name":"A-Team Theme","file":"tv/a-team.abc","category":"tv"},{"name":"Detective Conan Theme","file":"tv/detective_conan.abc","category":"tv"},{"name":"Fraggle Rock Theme","file":"tv/fraggle rock.abc","category":"tv"},{"name":"Mwana Wa Nnyabo","file":"ugandan/mwana wa nnyabo.abc","category":"ugandan"},{"name":"Nich Yaka Misyachna","file":"ukrainian/nich yaka misyachna.abc","category":"ukrainian"},{"name":"","file":"unsorted/test.abc","category":"unsorted"},{"name":"Spin the Wheel","file":"unsorted/spin the wheel.abc","category":"unsorted"},{"name":"The People United","file":"unsorted/people united.abc","category":"unsorted"},{"name":"Bèo Dạt Mây Trôi","file":"vietnamese/beo dat may troi.abc","category":"vietnamese"},{"name":"Chiribim Chiribom","file":"yiddish/chiribim.abc","category":"yiddish"},{"name":"Daloy Politsey","file":"yiddish/daloy politsey.abc","category":"yiddish"},{"name":"Dos Kelbl","file":"yiddish/dos kelbl.abc","category":"yiddish"},{"name":"In Kamf","file":"yiddish/in kamf.abc","category":"yiddish"},{"name":"Kankuluwe","file":"zambian/kankuluwe.abc","category":"zambian"}]');
     }
 }
@@ -1,31 +1,6 @@
 // Auto-generated docs file list - do not edit manually
 class DocsFileList {
     static getFiles() {
-        return [
-        {
-                "name": "Information Fields",
-                "file": "info_fields.md"
-        },
-        {
-                "name": "Notation",
-                "file": "notation.md"
-        },
-        {
-                "name": "Organizing ABC files",
-                "file": "organizing.md"
-        },
-        {
-                "name": "Other Sources",
-                "file": "other_sources.md"
-        },
-        {
-                "name": "Scales",
-                "file": "scales.md"
-        },
-        {
-                "name": "Sources of music",
-                "file": "music_sources.md"
-        }
-];
+        return JSON.parse('[{"name":"Information Fields","file":"info_fields.md"},{"name":"Notation","file":"notation.md"},{"name":"Organizing ABC files","file":"organizing.md"},{"name":"Other Sources","file":"other_sources.md"},{"name":"Scales","file":"scales.md"},{"name":"Sources of music","file":"music_sources.md"}]');
     }
 }
@@ -0,0 +1,261 @@
+"""Shared helpers for indexing the abc/ and docs/ folders.
+
+Used by scripts/update_data.py to build js/data/abc-file-list.js and
+js/data/docs-file-list.js.
+"""
+import os
+import re
+import json
+import filecmp
+import mmap
+import pickle
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: orjson serializes the file list much faster (py -m pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Markdown title pattern, compiled once rather than per file.
+H1_RE = re.compile(r'^#\s+(.*?)$', re.MULTILINE)
+
+# Tune headers are short; don't scan further than this past X: looking for T:.
+HEADER_MAX_LINES = 50
+
+# Below this size a buffered read is cheaper than setting up an mmap.
+MMAP_THRESHOLD = 8192
+
+# Header parsing is I/O-bound, so use more threads than cores.
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# File-list entries encoded per write when generating the JS files.
+STREAM_CHUNK_ENTRIES = 1024
+
+# Stdlib fallback encoder, built once: json.dumps() with non-default
+# arguments constructs a new JSONEncoder on every call.
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+def _scan_abc_header(lines):
+    """Return (valid, title) from an iterable of raw ABC lines; title may be None."""
+    valid = False
+    title = None
+    header_lines = 0
+    # Binary reads split only on \n; splitlines() also handles \r\n and old
+    # Mac \r-only line endings, as text mode did
+    lines = (line for chunk in lines for line in chunk.splitlines())
+    # Plain byte prefix checks instead of regexes; only the title line is decoded
+    for raw in lines:
+        if not valid and raw.startswith(b'X:'):
+            # X: field must contain a number
+            valid = raw[2:].lstrip()[:1].isdigit()
+        elif title is None and raw.startswith(b'T:'):
+            # T: field contains the title
+            title = raw[2:].strip().decode('utf-8', 'replace')
+        if valid:
+            # Only the tune header (from X: on) is bounded; the file header
+            # before it may be any length
+            header_lines += 1
+            if title is not None or not raw.strip() or header_lines >= HEADER_MAX_LINES:
+                break
+    return valid, title
+
+def parse_abc_header(abc_file_path):
+    """Read the header of an ABC file and return (valid, title).
+
+    valid is True when the file has an X: field with a number. Only the header
+    is read: scanning stops once both X: and T: are found, at the blank line
+    ending the first tune header, or HEADER_MAX_LINES lines into that header.
+    Files over MMAP_THRESHOLD bytes are memory-mapped rather than read into a
+    buffer. Read errors propagate; see abc_header_fallback().
+    """
+    with open(abc_file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                valid, title = _scan_abc_header(iter(mapped.readline, b''))
+        else:
+            valid, title = _scan_abc_header(file)
+
+    # Fall back to the filename without extension if no title found
+    if title is None:
+        title = os.path.basename(abc_file_path).replace('.abc', '')
+    return valid, title
+
+def abc_header_fallback(abc_file_path):
+    """Result for an ABC file that couldn't be read: leave it out of the list."""
+    return False, None
+
+def iter_files(root_dir, ext):
+    """Yield (DirEntry, rel_path) for every file ending in ext under root_dir.
+
+    rel_path always uses forward slashes, ready for use in URLs. Like
+    os.walk, subdirectories that can't be listed are skipped; only a failure
+    on root_dir itself is raised.
+    """
+    stack = [(root_dir, '')]
+    while stack:
+        dir_path, rel_prefix = stack.pop()
+        try:
+            scan = os.scandir(dir_path)
+        except OSError:
+            if dir_path == root_dir:
+                raise
+            continue
+        with scan as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_prefix + entry.name + '/'))
+                elif entry.name.endswith(ext) and entry.is_file():
+                    yield entry, rel_prefix + entry.name
+
+def load_cache(cache_path):
+    """Load the {rel_path: (mtime, size, result)} cache written by a previous run."""
+    try:
+        with open(cache_path, 'rb') as cache_file:
+            return pickle.load(cache_file)
+    except Exception:
+        return {}
+
+def save_cache(cache_path, cache):
+    """Write the parse cache sidecar for the next run."""
+    with open(cache_path, 'wb') as cache_file:
+        pickle.dump(cache, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _try_parse(parse, full_path):
+    """Return (True, parse(full_path)), or (False, None) if reading it failed."""
+    try:
+        return True, parse(full_path)
+    except Exception as e:
+        print(f"Error reading {full_path}: {e}")
+        return False, None
+
+def parse_files(entries, cache, parse, fallback):
+    """Run parse on every (DirEntry, rel_path), reusing cached results.
+
+    Files whose mtime and size match the cache are not reopened; the rest are
+    parsed on a thread pool. Files that fail to parse get fallback(full_path)
+    and are left out of the cache, so they are retried on the next run.
+    Returns (results, new_cache).
+    """
+    new_cache = {}
+    stale = []
+    for entry, rel_path in entries:
+        st = entry.stat()
+        hit = cache.get(rel_path)
+        if hit and hit[:2] == (st.st_mtime, st.st_size):
+            new_cache[rel_path] = hit
+        else:
+            stale.append((entry.path, rel_path, st.st_mtime, st.st_size))
+
+    failed = {}
+    if stale:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            parsed = executor.map(partial(_try_parse, parse),
+                                  [full_path for full_path, _, _, _ in stale])
+            for (full_path, rel_path, mtime, size), (ok, result) in zip(stale, parsed):
+                if ok:
+                    new_cache[rel_path] = (mtime, size, result)
+                else:
+                    failed[rel_path] = fallback(full_path)
+
+    results = [failed[rel_path] if rel_path in failed else new_cache[rel_path][2]
+               for _, rel_path in entries]
+    return results, new_cache
+
+def _to_json(data):
+    """Compact JSON text for data, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return _JSON_ENCODER.encode(data)
+
+def _js_single_quoted(text):
+    """Escape text for use inside a single-quoted JS string."""
+    return text.replace('\\', '\\\\').replace("'", "\\'")
+
+def build_file_list(root_dir, ext, parse, fallback, cache_path, sources=()):
+    """Parse every file ending in ext under root_dir.
+
+    Files that can't be read get fallback(full_path) instead, uncached.
+
+    The cache at cache_path is ignored if it is older than any file in
+    sources, so edits to the parsing code invalidate cached results.
+
+    Returns (results, cache): results is a list of (rel_path,
+    parse(full_path)) in walk order, and cache is the updated parse cache to
+    pass to save_cache() once the output is written.
+    """
+    entries = list(iter_files(root_dir, ext))
+    cache = load_cache(cache_path) if output_is_current(cache_path, *sources) else {}
+    parsed, cache = parse_files(entries, cache, parse, fallback)
+    results = [(rel_path, result) for (_, rel_path), result in zip(entries, parsed)]
+    return results, cache
+
+def output_is_current(path, *sources):
+    """True if path exists and is newer than every file in sources."""
+    try:
+        output_mtime = os.path.getmtime(path)
+        return all(output_mtime >= os.path.getmtime(source) for source in sources)
+    except OSError:
+        return False
+
+def replace_if_changed(tmp_path, path):
+    """Move tmp_path over path unless both files already match.
+
+    Leaving an identical file untouched avoids spurious git/dev-server
+    change notifications; os.replace() keeps the update atomic. Returns True
+    if path was replaced.
+    """
+    if os.path.exists(path) and filecmp.cmp(tmp_path, path, shallow=False):
+        os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, path)
+    return True
+
+def write_js_wrapper(js_file_path, class_name, data, description):
+    """Write data as a JS class whose static getFiles() returns it.
+
+    The list is embedded as `JSON.parse('...')`, which browsers parse much
+    faster than the equivalent object literal. Entries are encoded and
+    written STREAM_CHUNK_ENTRIES at a time rather than as one big string.
+    Returns True if the file changed.
+    """
+    tmp_path = js_file_path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', newline='\n') as js_file:
+            js_file.write(
+                f"// Auto-generated {description} - do not edit manually\n"
+                f"class {class_name} {{\n"
+                f"    static getFiles() {{\n"
+                f"        return JSON.parse('["
+            )
+            for start in range(0, len(data), STREAM_CHUNK_ENTRIES):
+                chunk = data[start:start + STREAM_CHUNK_ENTRIES]
+                if start:
+                    js_file.write(',')
+                js_file.write(','.join(_js_single_quoted(_to_json(item)) for item in chunk))
+            js_file.write(
+                "]');\n"
+                "    }\n"
+                "}\n"
+            )
+    except BaseException:
+        # Don't leave a half-written .tmp behind in the tracked js/data folder
+        os.remove(tmp_path)
+        raise
+    return replace_if_changed(tmp_path, js_file_path)
+
+def extract_doc_title(md_file_path):
+    """Extract the title from a markdown file; read errors propagate."""
+    with open(md_file_path, 'r', encoding='utf-8') as file:
+        content = file.read()
+        # Look for the first # heading
+        title_match = H1_RE.search(content)
+        if title_match:
+            return title_match.group(1).strip()
+    
+    return doc_title_fallback(md_file_path)
+
+def doc_title_fallback(md_file_path):
+    """Title from the filename, for docs without a heading or that can't be read."""
+    return os.path.basename(md_file_path).replace('.md', '').replace('_', ' ').title()
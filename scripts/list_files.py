@@ -1,39 +1,43 @@
 import os
+import shutil
+
+# Sources are copied through as raw bytes in chunks of this size.
+COPY_BUFFER_SIZE = 64 * 1024
 
 def create_file_listing(output_file="list_files.txt"):
     # Directories and files to list
     dirs_to_scan = ["../js", "../css"]
     specific_files = ["../index.html"]
     
-    with open(output_file, "w") as f:
+    with open(output_file, "wb") as f:
         # Process directories
         for directory in dirs_to_scan:
             if os.path.exists(directory):
                 for root, _, files in os.walk(directory):
                     for filename in files:
                         filepath = os.path.join(root, filename)
-                        f.write(f"==> Listing of {filepath} <==\n")
+                        f.write(f"==> Listing of {filepath} <==\n".encode())
                         try:
-                            with open(filepath, "r") as file_content:
-                                f.write(file_content.read())
-                                f.write("\n\n")
+                            with open(filepath, "rb") as file_content:
+                                shutil.copyfileobj(file_content, f, COPY_BUFFER_SIZE)
+                                f.write(b"\n\n")
                         except Exception as e:
-                            f.write(f"Error reading file: {str(e)}\n\n")
+                            f.write(f"Error reading file: {str(e)}\n\n".encode())
             else:
-                f.write(f"Directory {directory} does not exist\n\n")
+                f.write(f"Directory {directory} does not exist\n\n".encode())
         
         # Process specific files
         for filepath in specific_files:
             if os.path.exists(filepath):
-                f.write(f"==> Listing of {filepath} <==\n")
+                f.write(f"==> Listing of {filepath} <==\n".encode())
                 try:
-                    with open(filepath, "r") as file_content:
-                        f.write(file_content.read())
-                        f.write("\n\n")
+                    with open(filepath, "rb") as file_content:
+                        shutil.copyfileobj(file_content, f, COPY_BUFFER_SIZE)
+                        f.write(b"\n\n")
                 except Exception as e:
-                    f.write(f"Error reading file: {str(e)}\n\n")
+                    f.write(f"Error reading file: {str(e)}\n\n".encode())
             else:
-                f.write(f"File {filepath} does not exist\n\n")
+                f.write(f"File {filepath} does not exist\n\n".encode())
     
     print(f"File listing created in {output_file}")
 